@@ -5,6 +5,24 @@ try:
 except ImportError:
     __version__ = "0.1.0.dev0"
 
-from datamole.core import DataMole
+__all__ = ["DataMole", "DataMoleFileConfig", "__version__"]
 
-__all__ = ["DataMole", "__version__"]
+# Public names resolved on first access, so `import datamole` stays cheap
+_LAZY_EXPORTS = {
+    "DataMole": "datamole.core",
+    "DataMoleFileConfig": "datamole.config",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,66 @@
+"""
+YAML helpers for datamole configuration files.
+
+Uses the libyaml-backed safe loader/dumper when PyYAML was built with it,
+falling back to the pure-Python implementations otherwise.
+"""
+
+import os
+import stat
+import tempfile
+from typing import Any, Optional, IO
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:  # libyaml not available
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+# Process umask, for the mode of newly created files (os.umask can only be
+# read by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def load(stream) -> Any:
+    """Parse a YAML document from a string, bytes or file object."""
+    return yaml.load(stream, Loader=_SafeLoader)
+
+
+def dump(data: Any, stream: Optional[IO] = None) -> Optional[str]:
+    """Serialize data as block-style YAML, preserving key order.
+
+    Returns the YAML text if no stream is given.
+    """
+    return yaml.dump(data, stream, Dumper=_SafeDumper,
+                     default_flow_style=False, sort_keys=False)
+
+
+def dump_file(data: Any, file_path) -> None:
+    """Atomically write data as YAML to file_path.
+
+    The document is serialized up front and written with a single call to a
+    uniquely named temporary sibling file, which then replaces file_path.
+    Readers never see a partially written file, and an existing file keeps
+    its permissions.
+    """
+    text = dump(data)
+    file_path = os.fspath(file_path)
+    directory, name = os.path.split(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory or '.', prefix=f".{name}.")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            try:
+                mode = stat.S_IMODE(os.stat(file_path).st_mode)
+            except FileNotFoundError:
+                mode = 0o666 & ~_UMASK
+            # mkstemp creates the file 0600; give it the mode of the file it replaces
+            os.chmod(tmp_path, mode)
+            f.write(text)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
@@ -2,12 +2,17 @@
 CLI for datamole - simple data versioning tool.
 """
 
-import argparse
 import sys
-from datamole.core import DataMole
 
+# Commands that take no arguments; a bare `dtm <command>` for these is
+# dispatched directly, without importing argparse or building the parser
+_NO_ARG_COMMANDS = ('list-versions', 'current-version')
+
+
+def _build_parser():
+    """Build the argparse parser for all dtm commands."""
+    import argparse
 
-def main():
     parser = argparse.ArgumentParser(
         prog='dtm',
         description='datamole - Simple data versioning for ML projects'
@@ -106,48 +111,63 @@ def main():
     )
     delete_parser.add_argument('version_hash', help='Version hash to delete')
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    argv = sys.argv[1:]
+
+    if len(argv) == 1 and argv[0] in _NO_ARG_COMMANDS:
+        parser = args = None
+        command = argv[0]
+    else:
+        parser = _build_parser()
+        args = parser.parse_args(argv)
+        command = args.command
+
+        if not command:
+            parser.print_help()
+            sys.exit(0)
 
-    if not args.command:
-        parser.print_help()
-        sys.exit(0)
+    # Deferred so that --help and usage errors don't pay for importing core
+    from datamole.core import DataMole
 
     dtm = DataMole()
 
     try:
-        if args.command == 'init':
+        if command == 'init':
             dtm.init(
                 data_dir=args.data_dir,
                 no_pull=args.no_pull,
                 backend=args.backend
             )
         
-        elif args.command == 'config':
+        elif command == 'config':
             dtm.config_backend(
                 backend=args.backend,
                 remote_uri=args.remote_uri,
                 credentials_path=args.credentials
             )
         
-        elif args.command == 'add-version':
+        elif command == 'add-version':
             dtm.add_version(
                 message=args.message,
                 tag=args.tag
             )
         
-        elif args.command == 'pull':
+        elif command == 'pull':
             dtm.pull(
                 version=args.version,
                 force=args.force
             )
         
-        elif args.command == 'list-versions':
+        elif command == 'list-versions':
             dtm.list_versions()
         
-        elif args.command == 'current-version':
+        elif command == 'current-version':
             dtm.show_current_version()
         
-        elif args.command == 'delete-version':
+        elif command == 'delete-version':
             dtm.delete_version(args.version_hash)
         
         else:
@@ -6,14 +6,33 @@ and settings shared across all datamole projects.
 """
 
 import os
+import pickle
+import stat
 import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
-import yaml
 
+from datamole import _yaml
 from datamole.storage import BackendType
 
 
+def _home() -> str:
+    """Return the user's home directory ($HOME, or %USERPROFILE% on Windows)."""
+    return str(Path.home())
+
+
+# Memoized per home directory, so tests that repoint the home still see changes
+@lru_cache(maxsize=8)
+def _config_dir_for(home: str) -> Path:
+    return Path(home) / ".datamole"
+
+
+@lru_cache(maxsize=8)
+def _config_path_for(home: str) -> Path:
+    return _config_dir_for(home) / "config.yaml"
+
+
 class GlobalConfig:
     """Manages global datamole configuration at ~/.datamole/config.yaml.
     
@@ -32,6 +51,8 @@ class GlobalConfig:
                 default_bucket: my-bucket
     """
     
+    __slots__ = ('_config',)
+    
     _instance: Optional['GlobalConfig'] = None
     _lock = threading.Lock()
     
@@ -45,30 +66,78 @@ class GlobalConfig:
     @staticmethod
     def get_config_dir() -> Path:
         """Get the global datamole configuration directory (~/.datamole)."""
-        home = Path(os.environ.get('HOME', str(Path.home())))
-        return home / ".datamole"
+        return _config_dir_for(_home())
     
     @staticmethod
     def get_config_path() -> Path:
         """Get the path to global config file (~/.datamole/config.yaml)."""
-        return GlobalConfig.get_config_dir() / "config.yaml"
+        return _config_path_for(_home())
+    
+    @staticmethod
+    def get_cache_path() -> Path:
+        """Get the path to the parsed config cache (~/.datamole/config.cache)."""
+        return GlobalConfig.get_config_dir() / "config.cache"
+    
+    @staticmethod
+    def _cache_key(st: os.stat_result) -> tuple:
+        """Identify the current contents of config.yaml by its stat data."""
+        return (st.st_mtime_ns, st.st_size, st.st_ino)
+    
+    @classmethod
+    def _read_cache(cls, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return cached config data if it was parsed from the same file state."""
+        try:
+            with open(cls.get_cache_path(), 'rb') as f:
+                cached_key, config_data = pickle.load(f)
+        except Exception:
+            # Missing, truncated or incompatible cache - fall back to YAML
+            return None
+        return config_data if cached_key == key else None
+    
+    @classmethod
+    def _write_cache(cls, key: tuple, config_data: Dict[str, Any], mode: int):
+        """Atomically store parsed config data; failures are not fatal.
+        
+        The cache holds the same data as config.yaml, so it gets the same mode.
+        """
+        cache_path = cls.get_cache_path()
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        try:
+            # Start out private and only then widen to the config file's mode
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, 'wb') as f:
+                os.chmod(tmp_path, mode)
+                pickle.dump((key, config_data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass
     
     @classmethod
     def _load_from_disk(cls) -> 'GlobalConfig':
-        """Load configuration from disk (internal method)."""
+        """Load configuration from disk (internal method).
+        
+        The parsed YAML is cached in ~/.datamole/config.cache, keyed on the
+        config file's mtime, size and inode, so unchanged configs skip parsing.
+        """
         config_path = cls.get_config_path()
         
-        if not config_path.exists():
+        try:
+            st = os.stat(config_path)
+        except FileNotFoundError:
             raise FileNotFoundError(
                 f"Global datamole configuration not found at: {config_path}\n\n"
                 f"Please run the setup wizard first:\n"
                 f"  dtm config\n\n"
                 f"Or configure manually:\n"
                 f"  dtm config --backend local --storage-path ~/.datamole/storage"
-            )
+            ) from None
         
-        with open(config_path) as f:
-            config_data = yaml.safe_load(f) or {}
+        key = cls._cache_key(st)
+        config_data = cls._read_cache(key)
+        if config_data is None:
+            with open(config_path, 'rb') as f:
+                config_data = _yaml.load(f.read()) or {}
+            cls._write_cache(key, config_data, stat.S_IMODE(st.st_mode))
         
         return cls(config_data)
     
@@ -84,6 +153,10 @@ class GlobalConfig:
         Raises:
             FileNotFoundError: If config file doesn't exist with instructions
         """
+        # Fast path: once loaded, reading the cached instance needs no lock
+        instance = cls._instance
+        if instance is not None:
+            return instance
         with cls._lock:
             if cls._instance is None:
                 cls._instance = cls._load_from_disk()
@@ -102,6 +175,12 @@ class GlobalConfig:
             cls._instance = cls._load_from_disk()
             return cls._instance
     
+    @classmethod
+    def reset(cls) -> None:
+        """Drop the loaded instance so the next load() reads from disk again."""
+        with cls._lock:
+            cls._instance = None
+    
     def get_backend_config(self, backend_type: BackendType) -> Dict[str, Any]:
         """Get configuration for a specific backend.
         
@@ -147,8 +226,12 @@ class GlobalConfig:
         config_dir.mkdir(parents=True, exist_ok=True)
         
         # Write config
-        with open(config_path, 'w') as f:
-            yaml.dump(self._config, f, default_flow_style=False, sort_keys=False)
+        _yaml.dump_file(self._config, config_path)
+        # The next load re-parses config.yaml and caches what it read
+        try:
+            os.unlink(self.get_cache_path())
+        except FileNotFoundError:
+            pass
     
     @classmethod
     def initialize_defaults(cls) -> 'GlobalConfig':
@@ -161,10 +244,6 @@ class GlobalConfig:
             GlobalConfig instance
         """
         config_dir = cls.get_config_dir()
-        config_path = cls.get_config_path()
-        
-        # Create directory if it doesn't exist
-        config_dir.mkdir(parents=True, exist_ok=True)
         
         # Create default config
         default_config = {
@@ -175,11 +254,10 @@ class GlobalConfig:
             }
         }
         
-        # Write config
-        with open(config_path, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False, sort_keys=False)
-        
-        # Return loaded instance
+        # Write config first; only a config that reached disk becomes the
+        # cached instance
         with cls._lock:
-            cls._instance = cls(default_config)
-            return cls._instance
+            instance = cls(default_config)
+            instance.save()
+            cls._instance = instance
+            return instance
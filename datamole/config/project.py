@@ -4,12 +4,42 @@ Project-level configuration for datamole (.datamole file).
 
 import os
 import re
+from bisect import bisect_left, insort
 from dataclasses import dataclass, field
-from typing import List, Optional, Dict
-import yaml
+from typing import List, Optional, Dict, Iterable, Tuple
 
+from datamole import _yaml
 
-@dataclass
+# Precompiled pattern for ProjectConfig.validate_tag
+_TAG_RE = re.compile(r'\A[A-Za-z0-9._-]+\Z')
+
+# Parsed .datamole data per absolute path, with the stat key it was read at
+_CONFIG_CACHE: Dict[str, Tuple[tuple, dict]] = {}
+
+
+def _stat_key(path: str) -> tuple:
+    """Identify the current contents of a file by its stat data."""
+    st = os.stat(path)
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def _copy_data(data: dict) -> dict:
+    """Copy parsed .datamole data deeply enough that versions can be mutated."""
+    copied = dict(data)
+    copied["versions"] = [dict(v) for v in data.get("versions") or []]
+    return copied
+
+
+def _cache_data(file_path: str, data: dict):
+    """Remember the data just read from or written to file_path."""
+    path = os.path.abspath(file_path)
+    try:
+        _CONFIG_CACHE[path] = (_stat_key(path), _copy_data(data))
+    except OSError:
+        _CONFIG_CACHE.pop(path, None)
+
+
+@dataclass(slots=True)
 class ProjectConfig:
     """Manages per-project .datamole file configuration.
     
@@ -29,6 +59,10 @@ class ProjectConfig:
     
     Note: Backend configuration (remote_uri, credentials) is NOT stored here.
           It is managed globally in ~/.datamole/config.yaml via GlobalConfig.
+    
+    Lookups notice when `versions` is reassigned or changes length. After
+    editing it in place without changing its length (replacing an entry, or
+    a pop followed by an append), call _invalidate_indices().
     """
 
     project: str
@@ -37,16 +71,59 @@ class ProjectConfig:
     backend_type: Optional[str] = None
     versions: List[Dict[str, str]] = field(default_factory=list)
     _file_path: Optional[str] = field(default=None, init=False, repr=False)
+    # Lookup indices over `versions`, built lazily by _ensure_indices()
+    _hash_index: Optional[Dict[str, Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _tag_index: Optional[Dict[str, Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _sorted_hashes: Optional[List[Tuple[str, int]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    # The versions list and its length when the indices were built
+    _indexed_list: Optional[List[Dict[str, str]]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _indexed_count: int = field(default=0, init=False, repr=False, compare=False)
+    # Memoized get_absolute_data_path() result and the (file, dir) it was built from
+    _abs_data_path: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _abs_data_path_key: Optional[Tuple[str, str]] = field(
+        default=None, init=False, repr=False, compare=False)
 
     @classmethod
     def load(cls, file_path: str) -> 'ProjectConfig':
         """Load configuration from existing .datamole file."""
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"No .datamole file found at {file_path}")
+        # Read the whole file in one call and hand the parser a single buffer
+        try:
+            with open(file_path, 'rb') as f:
+                buf = f.read()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No .datamole file found at {file_path}") from None
+        data = _yaml.load(buf)
+        return cls._from_data(data, file_path)
+    
+    @classmethod
+    def load_cached(cls, file_path: str) -> 'ProjectConfig':
+        """Load configuration, reusing an earlier parse from this process.
+        
+        Parsed data is memoized per path and keyed on the file's mtime, size
+        and inode, so changes made by other processes are picked up. Every
+        call returns a new ProjectConfig that shares no mutable state.
+        """
+        path = os.path.abspath(file_path)
+        try:
+            key = _stat_key(path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"No .datamole file found at {file_path}") from None
         
-        with open(file_path) as f:
-            data = yaml.safe_load(f)
+        cached = _CONFIG_CACHE.get(path)
+        if cached is not None and cached[0] == key:
+            return cls._from_data(_copy_data(cached[1]), file_path)
         
+        config = cls.load(file_path)
+        _CONFIG_CACHE[path] = (key, _copy_data(config._to_data()))
+        return config
+    
+    @classmethod
+    def _from_data(cls, data: dict, file_path: str) -> 'ProjectConfig':
+        """Build a config from parsed .datamole data."""
         config = cls(
             project=data.get("project", ""),
             data_directory=data.get("data_directory", None),
@@ -57,6 +134,16 @@ class ProjectConfig:
         config._file_path = file_path
         return config
     
+    def _to_data(self) -> dict:
+        """Return the data written to the .datamole file."""
+        return {
+            "project": self.project,
+            "data_directory": self.data_directory,
+            "current_version": self.current_version,
+            "backend_type": self.backend_type,
+            "versions": self.versions,
+        }
+    
     @classmethod
     def create(cls, file_path: str, project: str, data_directory: Optional[str] = None, 
                backend_type: str = "local") -> 'ProjectConfig':
@@ -65,22 +152,30 @@ class ProjectConfig:
         Note: Backend configuration (remote_uri, credentials) is not stored in .datamole.
         It is managed globally in ~/.datamole/config.yaml
         """
-        # Validate the directory exists and is writable
-        directory = os.path.dirname(file_path) or '.'
-        if not os.path.exists(directory):
-            raise FileNotFoundError(f"Directory does not exist: {directory}")
-        if not os.access(directory, os.W_OK):
-            raise PermissionError(f"Directory is not writable: {directory}")
-        if os.path.exists(file_path):
-            raise FileExistsError(f"File already exists: {file_path}")
-        
         # Validate data_directory is relative path
         if data_directory and os.path.isabs(data_directory):
             raise ValueError(f"data_directory must be a relative path, got: {data_directory}")
+        
+        # Claim the file with an exclusive create, which also checks that the
+        # directory exists and is writable
+        directory = os.path.dirname(file_path) or '.'
+        try:
+            with open(file_path, 'x'):
+                pass
+        except FileExistsError:
+            raise FileExistsError(f"File already exists: {file_path}") from None
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Directory does not exist: {directory}") from None
+        except PermissionError:
+            raise PermissionError(f"Directory is not writable: {directory}") from None
 
         config = cls(project=project, data_directory=data_directory, backend_type=backend_type)
         config._file_path = file_path
-        config.save()
+        try:
+            config.save()
+        except BaseException:
+            os.unlink(file_path)
+            raise
         return config
     
     def save(self):
@@ -88,22 +183,9 @@ class ProjectConfig:
         if not self._file_path:
             raise ValueError("File path for .datamole file is not set.")
         
-        # Validate the directory exists and is writable
-        directory = os.path.dirname(self._file_path) or '.'
-        if not os.path.exists(directory):
-            raise FileNotFoundError(f"Directory does not exist: {directory}")
-        if not os.access(directory, os.W_OK):
-            raise PermissionError(f"Directory is not writable: {directory}")
-        
-        data = {
-            "project": self.project,
-            "data_directory": self.data_directory,
-            "current_version": self.current_version,
-            "backend_type": self.backend_type,
-            "versions": self.versions,
-        }
-        with open(self._file_path, 'w') as f:
-            yaml.dump(data, f, default_flow_style=False, sort_keys=False)
+        data = self._to_data()
+        _yaml.dump_file(data, self._file_path)
+        _cache_data(self._file_path, data)
     
     def get_absolute_data_path(self) -> str:
         """Resolve data_directory to absolute path based on .datamole file location."""
@@ -112,10 +194,20 @@ class ProjectConfig:
         if not self.data_directory:
             raise ValueError("data_directory not configured")
         
+        key = (self._file_path, self.data_directory)
+        if key == self._abs_data_path_key:
+            return self._abs_data_path
+        
         # Get directory containing .datamole file
         config_dir = os.path.dirname(self._file_path) or '.'
         # Resolve relative data_directory to absolute path
-        return os.path.abspath(os.path.join(config_dir, self.data_directory))
+        abs_path = os.path.abspath(os.path.join(config_dir, self.data_directory))
+        
+        # A relative file path resolves against the cwd, which may change
+        if os.path.isabs(self._file_path):
+            self._abs_data_path = abs_path
+            self._abs_data_path_key = key
+        return abs_path
     
     @staticmethod
     def validate_tag(tag: str) -> str:
@@ -137,7 +229,7 @@ class ProjectConfig:
             raise ValueError("Tag cannot be empty")
         
         # Allow alphanumeric, hyphen, underscore, dot
-        if not re.match(r'^[a-zA-Z0-9._-]+$', tag):
+        if not _TAG_RE.match(tag):
             raise ValueError(
                 f"Tag '{tag}' contains invalid characters. "
                 f"Only alphanumeric characters, hyphens, underscores, and dots are allowed."
@@ -146,7 +238,8 @@ class ProjectConfig:
         return tag
     
     def add_version_entry(self, version_hash: str, timestamp: str, 
-                         message: Optional[str] = None, tag: Optional[str] = None):
+                         message: Optional[str] = None, tag: Optional[str] = None,
+                         flush: bool = True):
         """Add a new version entry to the versions list.
         
         Args:
@@ -154,6 +247,8 @@ class ProjectConfig:
             timestamp: ISO 8601 timestamp
             message: Optional description
             tag: Optional tag for easy lookup (must be unique)
+            flush: If False, don't write the .datamole file; the caller
+                   is responsible for calling save() afterwards
             
         Raises:
             ValueError: If tag is invalid or already exists
@@ -174,6 +269,32 @@ class ProjectConfig:
             version_entry["tag"] = tag
         
         self.versions.append(version_entry)
+        self._index_entry(version_entry, len(self.versions) - 1)
+        if flush:
+            self.save()
+    
+    def add_version_entries(self, entries: Iterable[Dict[str, str]]):
+        """Add several version entries and save the .datamole file once.
+        
+        Args:
+            entries: Dicts with "hash" and "timestamp" keys and optional
+                     "message" and "tag" keys
+            
+        Raises:
+            ValueError: If any tag is invalid or duplicated; no entries
+                        are added in that case
+        """
+        start = len(self.versions)
+        try:
+            for entry in entries:
+                self.add_version_entry(entry["hash"], entry["timestamp"],
+                                       entry.get("message"), entry.get("tag"),
+                                       flush=False)
+        except BaseException:
+            # Drop the partial batch and let the indices rebuild on next lookup
+            del self.versions[start:]
+            self._invalidate_indices()
+            raise
         self.save()
     
     def get_latest_version(self) -> Optional[str]:
@@ -182,16 +303,51 @@ class ProjectConfig:
             return None
         return self.versions[-1]["hash"]
     
+    def _ensure_indices(self):
+        """Build the hash/tag indices, rebuilding them if versions changed.
+        
+        The first entry wins for duplicate hashes or tags, matching a linear scan.
+        """
+        if (self._hash_index is not None and self._indexed_list is self.versions
+                and self._indexed_count == len(self.versions)):
+            return
+        self._hash_index = {}
+        self._tag_index = {}
+        for version in self.versions:
+            self._hash_index.setdefault(version["hash"], version)
+            if version.get("tag") is not None:
+                self._tag_index.setdefault(version["tag"], version)
+        self._sorted_hashes = sorted((v["hash"], i) for i, v in enumerate(self.versions))
+        self._indexed_list = self.versions
+        self._indexed_count = len(self.versions)
+    
+    def _invalidate_indices(self):
+        """Drop the hash/tag indices so the next lookup rebuilds them.
+        
+        Needed after in-place edits to versions that keep its length.
+        """
+        self._hash_index = None
+    
+    def _index_entry(self, version: Dict[str, str], position: int):
+        """Add a newly appended version entry to the indices if they are built."""
+        if (self._hash_index is None or self._indexed_list is not self.versions
+                or self._indexed_count != position):
+            return
+        self._hash_index.setdefault(version["hash"], version)
+        if version.get("tag") is not None:
+            self._tag_index.setdefault(version["tag"], version)
+        insort(self._sorted_hashes, (version["hash"], position))
+        self._indexed_count += 1
+    
     def has_version(self, version_hash: str) -> bool:
         """Check if a version hash exists in the versions list."""
-        return any(v["hash"] == version_hash for v in self.versions)
+        self._ensure_indices()
+        return version_hash in self._hash_index
     
     def get_version_info(self, version_hash: str) -> Optional[Dict[str, str]]:
         """Get version metadata for a specific hash."""
-        for version in self.versions:
-            if version["hash"] == version_hash:
-                return version
-        return None
+        self._ensure_indices()
+        return self._hash_index.get(version_hash)
     
     def get_version_by_tag(self, tag: str) -> Optional[Dict[str, str]]:
         """Get version metadata for a specific tag.
@@ -202,10 +358,8 @@ class ProjectConfig:
         Returns:
             Version dict if found, None otherwise
         """
-        for version in self.versions:
-            if version.get("tag") == tag:
-                return version
-        return None
+        self._ensure_indices()
+        return self._tag_index.get(tag)
     
     def has_tag(self, tag: str) -> bool:
         """Check if a tag already exists.
@@ -216,7 +370,8 @@ class ProjectConfig:
         Returns:
             True if tag exists, False otherwise
         """
-        return any(v.get("tag") == tag for v in self.versions)
+        self._ensure_indices()
+        return tag in self._tag_index
     
     def get_versions_by_hash_prefix(self, prefix: str) -> List[Dict[str, str]]:
         """Get versions matching a hash prefix.
@@ -233,9 +388,14 @@ class ProjectConfig:
         if len(prefix) < 4:
             raise ValueError(f"Hash prefix must be at least 4 characters, got: {prefix}")
         
-        matches = []
-        for version in self.versions:
-            if version["hash"].startswith(prefix):
-                matches.append(version)
+        # All hashes starting with prefix form a contiguous run in sorted order
+        self._ensure_indices()
+        sorted_hashes = self._sorted_hashes
+        positions = []
+        for i in range(bisect_left(sorted_hashes, (prefix,)), len(sorted_hashes)):
+            version_hash, position = sorted_hashes[i]
+            if not version_hash.startswith(prefix):
+                break
+            positions.append(position)
         
-        return matches
+        return [self.versions[i] for i in sorted(positions)]
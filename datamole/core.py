@@ -3,45 +3,74 @@ Main logic for datamole core functions. Provides the DataMole class API.
 """
 
 import os
-import getpass
+import re
+import sys
 import secrets
-from datetime import datetime
+import time
+from functools import cached_property
 from pathlib import Path
-import yaml
 from typing import Optional
 
+from datamole import _yaml
 from datamole.config import ProjectConfig
 from datamole.config.global_config import GlobalConfig
 from datamole.storage import BackendType, create_storage_backend, StorageError
 
+# `key = value` lines in .config for the keys DataMole reads; values are trimmed
+# and comment lines never match because the key must start the line
+_CONFIG_RE = re.compile(
+    rb'^[^\S\n]*(remote_uri|auth_token)[^\S\n]*=[^\S\n]*(.*?)[^\S\n]*$', re.M
+)
+
+# Candidate hash prefixes in pull(): at least 4 lowercase hex characters
+_HEX_PREFIX_RE = re.compile(r'[0-9a-f]{4,}')
+
+
+def _is_nonempty(path: Path) -> bool:
+    """Check whether a directory has any entries, reading at most one."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is not None
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time as ISO 8601 with microseconds and a Z suffix."""
+    seconds, nanos = divmod(time.time_ns(), 1_000_000_000)
+    return (time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+            + f'.{nanos // 1000:06d}Z')
+
 
 class DataMole:
     def __init__(self, config_path=None):
         """
         Initialize a DataMole instance.
-        Loads config, sets user, remote, and state.
+        Loads config, sets remote and state. The user is looked up on first
+        access.
         """
-        self.user = getpass.getuser()
-        self.config_path = config_path or os.path.join(os.getcwd(), ".config")
+        cwd = os.getcwd()
+        self.config_path = config_path or os.path.join(cwd, ".config")
         self.remote_uri = None
         self.auth_token = None
-        self.project_name = os.path.basename(os.getcwd())
-        self.datamole_file = os.path.join(os.getcwd(), ".datamole")
+        self.project_name = os.path.basename(cwd)
+        self.datamole_file = os.path.join(cwd, ".datamole")
         self._config = None  # Lazy-loaded ProjectConfig
         self._load_config()
 
     def _load_config(self):
         """Load config from .config file if present."""
-        if os.path.exists(self.config_path):
-            with open(self.config_path) as f:
-                for line in f:
-                    if line.strip() and not line.strip().startswith('#'):
-                        if '=' in line:
-                            k, v = line.strip().split('=', 1)
-                            if k.strip() == 'remote_uri':
-                                self.remote_uri = v.strip()
-                            elif k.strip() == 'auth_token':
-                                self.auth_token = v.strip()
+        try:
+            with open(self.config_path, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        # Later assignments win, as with a line-by-line parse
+        for key, value in _CONFIG_RE.findall(data):
+            setattr(self, key.decode(), value.decode())
+
+    @cached_property
+    def user(self) -> str:
+        """Login name of the current user, resolved on first access."""
+        import getpass
+        return getpass.getuser()
     
     @property
     def config(self) -> ProjectConfig:
@@ -49,9 +78,27 @@ class DataMole:
         if self._config is None:
             if not os.path.exists(self.datamole_file):
                 raise RuntimeError("No .datamole file found. Run 'dtm init' first.")
-            self._config = ProjectConfig.load(self.datamole_file)
+            self._config = ProjectConfig.load_cached(self.datamole_file)
         return self._config
 
+    @staticmethod
+    def _get_storage_backend(backend_type: str):
+        """Create the storage backend for backend_type.
+        
+        The global config (~/.datamole/config.yaml) is only loaded here, at the
+        point a backend is actually needed.
+        
+        Raises:
+            FileNotFoundError: If the global config does not exist
+            ValueError: If backend_type is not a supported backend
+            RuntimeError: If the backend is not configured
+            StorageError: If the backend cannot be created
+        """
+        global_config = GlobalConfig.load()
+        backend_enum = BackendType.from_string(backend_type)
+        backend_config = global_config.get_backend_config(backend_enum)
+        return create_storage_backend(backend_enum, backend_config)
+
     def init(self, data_dir: str = "data", no_pull: bool = False,
              backend: str = "local") -> None:
         """Initialize datamole in a repo.
@@ -73,41 +120,33 @@ class DataMole:
             - Verifies backend is accessible via backend.setup()
             - Auto-downloads current_version unless no_pull=True
         """
-        # Load global config (will fail with helpful message if not configured)
-        try:
-            global_config = GlobalConfig.load()
-        except FileNotFoundError as e:
-            print(str(e))
-            raise
         # Case B: Existing .datamole file
         if os.path.exists(self.datamole_file):
             print(f"Found existing .datamole file for project '{self.project_name}'.")
             
-            # Load the config
-            self._config = ProjectConfig.load(self.datamole_file)
+            # Load the config (shared with the config property and pull())
+            config = self.config
             
-            if not self._config.backend_type:
+            if not config.backend_type:
                 raise ValueError(".datamole file missing backend_type. File may be corrupted.")
             
             # Verify backend is configured and accessible
             try:
-                backend_enum = BackendType.from_string(self._config.backend_type)
-                backend_config = global_config.get_backend_config(backend_enum)
-                storage_backend = create_storage_backend(backend_enum, backend_config)
+                storage_backend = self._get_storage_backend(config.backend_type)
                 storage_backend.setup(self.project_name)
-                print(f"Using {self._config.backend_type} backend.")
-            except (StorageError, RuntimeError) as e:
+                print(f"Using {config.backend_type} backend.")
+            except (FileNotFoundError, StorageError, RuntimeError) as e:
                 print(f"Error: {e}")
                 raise
             
             # Auto-pull current version unless disabled
-            if not no_pull and self._config.current_version:
-                print(f"Auto-downloading current version: {self._config.current_version}")
+            if not no_pull and config.current_version:
+                print(f"Auto-downloading current version: {config.current_version}")
                 try:
-                    self.pull(self._config.current_version)
+                    self.pull(config.current_version)
                 except Exception as e:
                     print(f"Warning: Could not auto-download version: {e}")
-            elif not self._config.current_version:
+            elif not config.current_version:
                 print("No current version set. Use 'dtm pull <hash>' to download a version.")
             else:
                 print("Auto-pull disabled. Use 'dtm pull' to download data.")
@@ -119,10 +158,8 @@ class DataMole:
         
         # Validate and load backend
         try:
-            backend_enum = BackendType.from_string(backend)
-            backend_config = global_config.get_backend_config(backend_enum)
-            storage_backend = create_storage_backend(backend_enum, backend_config)
-        except (ValueError, StorageError, RuntimeError) as e:
+            storage_backend = self._get_storage_backend(backend)
+        except (FileNotFoundError, ValueError, StorageError, RuntimeError) as e:
             print(f"Error: {e}")
             raise
         
@@ -234,7 +271,7 @@ class DataMole:
             )
         
         # Validate data directory is not empty
-        if not any(data_path.iterdir()):
+        if not _is_nonempty(data_path):
             raise ValueError(
                 f"Data directory is empty: {data_path}\n"
                 f"Add some data before creating a version."
@@ -247,7 +284,7 @@ class DataMole:
         max_attempts = 10
         version_hash = None
         for _ in range(max_attempts):
-            candidate_hash = secrets.token_hex(4)  # 4 bytes = 8 hex chars
+            candidate_hash = secrets.token_bytes(4).hex()  # 4 bytes = 8 hex chars
             if not config.has_version(candidate_hash):
                 version_hash = candidate_hash
                 break
@@ -258,14 +295,11 @@ class DataMole:
         print(f"Generated version hash: {version_hash}")
         
         # Get timestamp
-        timestamp = datetime.utcnow().isoformat() + "Z"
+        timestamp = _utc_timestamp()
         
         # Load storage backend
         try:
-            global_config = GlobalConfig.load()
-            backend_enum = BackendType.from_string(config.backend_type)
-            backend_config = global_config.get_backend_config(backend_enum)
-            storage_backend = create_storage_backend(backend_enum, backend_config)
+            storage_backend = self._get_storage_backend(config.backend_type)
         except (ValueError, StorageError, RuntimeError, FileNotFoundError) as e:
             raise RuntimeError(f"Failed to load storage backend: {e}") from e
         
@@ -286,7 +320,7 @@ class DataMole:
             ) from e
         
         # Upload succeeded - now update .datamole
-        config.add_version_entry(version_hash, timestamp, message, tag)
+        config.add_version_entry(version_hash, timestamp, message, tag, flush=False)
         config.current_version = version_hash
         config.save()
         
@@ -303,10 +337,10 @@ class DataMole:
         if not os.path.exists(self.datamole_file):
             print("No .datamole file found.")
             return
-        with open(self.datamole_file) as f:
-            meta = yaml.safe_load(f)
-        for v in meta.get("versions", []):
-            print(v)
+        with open(self.datamole_file, 'rb') as f:
+            meta = _yaml.load(f.read())
+        # Emit the whole listing with one write instead of a print per entry.
+        sys.stdout.write("".join(f"{v}\n" for v in meta.get("versions", [])))
 
     def pull(self, version: Optional[str] = None, force: bool = False):
         """Pull a version from remote storage to data_directory.
@@ -354,7 +388,7 @@ class DataMole:
                 version_hash = version
                 lookup_method = "hash"
             # Try hash prefix match (if looks like hex and >= 4 chars)
-            elif len(version) >= 4 and all(c in "0123456789abcdef" for c in version.lower()):
+            elif _HEX_PREFIX_RE.fullmatch(version.lower()):
                 matches = config.get_versions_by_hash_prefix(version.lower())
                 if len(matches) == 0:
                     pass  # Will try tag lookup next
@@ -393,7 +427,7 @@ class DataMole:
         data_path = Path(config.get_absolute_data_path())
         
         # Check if data directory exists and has content
-        if data_path.exists() and any(data_path.iterdir()):
+        if data_path.exists() and _is_nonempty(data_path):
             if not force:
                 response = input(f"\nData directory '{config.data_directory}' is not empty. Overwrite? [y/N]: ")
                 if response.lower() != 'y':
@@ -403,10 +437,7 @@ class DataMole:
         
         # Load storage backend
         try:
-            global_config = GlobalConfig.load()
-            backend_enum = BackendType.from_string(config.backend_type)
-            backend_config = global_config.get_backend_config(backend_enum)
-            storage_backend = create_storage_backend(backend_enum, backend_config)
+            storage_backend = self._get_storage_backend(config.backend_type)
         except (ValueError, StorageError, RuntimeError, FileNotFoundError) as e:
             raise RuntimeError(f"Failed to load storage backend: {e}") from e
         
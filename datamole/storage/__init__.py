@@ -0,0 +1,197 @@
+"""
+Remote storage handling for datamole.
+
+Supports multiple storage backends:
+- Local file storage (for testing and simple use cases)
+- GCS (Google Cloud Storage)
+- S3 (Amazon S3)
+- Azure Blob Storage
+- Remote file storage (SFTP, etc.)
+
+BackendType, StorageBackend and StorageError are defined here. Backend
+implementations live in submodules that are only imported when first
+used, so code that just needs the enum or exception stays cheap to import.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Any, List
+from enum import Enum
+
+
+class BackendType(Enum):
+    """Enum for supported storage backend types."""
+    LOCAL = "local"
+    GCS = "gcs"
+    S3 = "s3"
+    AZURE = "azure"
+    
+    @classmethod
+    def from_string(cls, value: str) -> 'BackendType':
+        """Convert string to BackendType enum."""
+        # Enum value lookup is a dict hit, unlike iterating over the members
+        try:
+            return cls(value.lower())
+        except ValueError:
+            raise ValueError(f"Unsupported backend type: {value}. "
+                            f"Supported types: {', '.join(b.value for b in cls)}") from None
+
+
+class StorageBackend(ABC):
+    """Abstract base class for storage backends."""
+    
+    @abstractmethod
+    def setup(self, project_name: str) -> None:
+        """
+        Set up storage for a new project (or verify existing setup).
+        
+        This is called when a project is first initialized with datamole.
+        The backend should:
+        - Verify that the remote storage location is accessible
+        - Create the project directory structure if needed
+        - Validate credentials/permissions
+        
+        Args:
+            project_name: Name of the project to set up
+            
+        Raises:
+            StorageError: If setup fails or remote is not accessible
+        """
+        pass
+    
+    @abstractmethod
+    def upload_directory(self, local_path: Path, remote_path: str) -> None:
+        """
+        Upload entire directory to remote storage.
+        
+        Args:
+            local_path: Local directory path to upload
+            remote_path: Remote destination path (backend-specific format)
+            
+        Raises:
+            StorageError: If upload fails
+        """
+        pass
+    
+    async def upload_directory_async(self, local_path: Path, remote_path: str) -> None:
+        """
+        Upload entire directory to remote storage from a coroutine.
+        
+        The default runs upload_directory in a worker thread. Network
+        backends should override this to upload files concurrently.
+        
+        Args:
+            local_path: Local directory path to upload
+            remote_path: Remote destination path (backend-specific format)
+            
+        Raises:
+            StorageError: If upload fails
+        """
+        import asyncio
+        await asyncio.to_thread(self.upload_directory, local_path, remote_path)
+    
+    @abstractmethod
+    def download_directory(self, remote_path: str, local_path: Path) -> None:
+        """
+        Download entire directory from remote storage.
+        
+        Args:
+            remote_path: Remote source path (backend-specific format)
+            local_path: Local destination directory path
+            
+        Raises:
+            StorageError: If download fails
+        """
+        pass
+    
+    @abstractmethod
+    def list_versions(self, project_name: str) -> List[str]:
+        """
+        List all version hashes available in remote storage for a project.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            List of version hash strings
+        """
+        pass
+    
+    @abstractmethod
+    def version_exists(self, project_name: str, version_hash: str) -> bool:
+        """
+        Check if a version exists in remote storage.
+        
+        Args:
+            project_name: Name of the project
+            version_hash: Version hash to check
+            
+        Returns:
+            True if version exists, False otherwise
+        """
+        pass
+
+
+class StorageError(Exception):
+    """Raised when storage operations fail."""
+    pass
+
+
+# Backend classes resolved lazily from their submodules
+_LAZY_BACKENDS = {
+    "LocalStorageBackend": "datamole.storage.local",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_BACKENDS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def create_storage_backend(backend_type: BackendType, backend_config: Dict[str, Any]) -> StorageBackend:
+    """
+    Factory function to create storage backend instances.
+    
+    Args:
+        backend_type: Type of backend to create
+        backend_config: Backend configuration dict from GlobalConfig
+        
+    Returns:
+        StorageBackend instance
+        
+    Raises:
+        StorageError: If backend not implemented
+    """
+    if backend_type == BackendType.LOCAL:
+        from datamole.storage.local import LocalStorageBackend
+        
+        storage_path = backend_config.get("storage_path")
+        if not storage_path:
+            raise StorageError(
+                "Local backend configuration missing 'storage_path'.\n"
+                "Please run: dtm config --backend local --storage-path <path>"
+            )
+        return LocalStorageBackend(storage_path)
+    
+    elif backend_type == BackendType.GCS:
+        # TODO: Implement GCS backend
+        # Will use backend_config['service_account_json'], backend_config['default_bucket'], etc.
+        raise NotImplementedError("GCS backend not yet implemented")
+    
+    elif backend_type == BackendType.S3:
+        # TODO: Implement S3 backend
+        # Will use backend_config['aws_profile'], backend_config['default_bucket'], etc.
+        raise NotImplementedError("S3 backend not yet implemented")
+    
+    elif backend_type == BackendType.AZURE:
+        # TODO: Implement Azure backend
+        # Will use backend_config credentials
+        raise NotImplementedError("Azure backend not yet implemented")
+    
+    else:
+        raise StorageError(f"Unsupported backend type: {backend_type}")
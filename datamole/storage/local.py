@@ -0,0 +1,294 @@
+"""
+Local file system storage backend for datamole.
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import List
+import os
+import shutil
+import sys
+
+from datamole.storage import StorageBackend, StorageError
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows
+    fcntl = None
+
+
+_IS_LINUX = sys.platform.startswith("linux")
+
+# Linux ioctl request for FICLONE (_IOW(0x94, 9, int)): reflink dst to src
+_FICLONE = 0x40049409
+
+# Copying many small files is bound by per-file syscall latency, not bandwidth
+_COPY_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+def _copy_file_in_kernel(src: str, dst: str) -> bool:
+    """Copy src to dst without passing the data through user space.
+    
+    Tries a FICLONE reflink first, which shares blocks on copy-on-write
+    filesystems such as btrfs and XFS, then os.copy_file_range.
+    
+    Returns:
+        True if the file was copied, False if neither mechanism applies
+    """
+    with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+        in_fd, out_fd = fsrc.fileno(), fdst.fileno()
+        try:
+            fcntl.ioctl(out_fd, _FICLONE, in_fd)
+            return True
+        except OSError:
+            pass
+        
+        remaining = os.fstat(in_fd).st_size
+        try:
+            while remaining > 0:
+                copied = os.copy_file_range(in_fd, out_fd, remaining)
+                if copied == 0:
+                    # Short copy (e.g. the file shrank, or a filesystem that
+                    # reports no data); let the caller copy in user space
+                    return False
+                remaining -= copied
+        except OSError:
+            # e.g. EXDEV across filesystems on older kernels
+            return False
+        return True
+
+
+def _copy_file(src: str, dst: str) -> None:
+    """Copy a file with its metadata, like shutil.copy2.
+    
+    On Linux the contents are copied in the kernel where possible; otherwise
+    this falls back to shutil.copyfile.
+    """
+    if not (_IS_LINUX and fcntl is not None and _copy_file_in_kernel(src, dst)):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def _fast_copytree(src: Path, dst: Path) -> None:
+    """Copy a directory tree, copying files concurrently.
+    
+    Like shutil.copytree, dst must not exist and symlinks are followed. The
+    directory skeleton is created first, single-threaded to avoid mkdir
+    races; files are then copied on a thread pool. The first failed copy
+    is re-raised after cancelling any copies that have not started.
+    """
+    os.makedirs(dst)
+    dirs = [(src, dst)]
+    files = []
+    
+    def _raise(error: OSError) -> None:
+        # os.walk skips unreadable directories by default; a partial copy
+        # must fail instead, as it would with shutil.copytree
+        raise error
+    
+    for dirpath, dirnames, filenames in os.walk(src, onerror=_raise, followlinks=True):
+        rel = os.path.relpath(dirpath, src)
+        target = dst if rel == os.curdir else os.path.join(dst, rel)
+        for name in dirnames:
+            os.mkdir(os.path.join(target, name))
+            dirs.append((os.path.join(dirpath, name), os.path.join(target, name)))
+        for name in filenames:
+            files.append((os.path.join(dirpath, name), os.path.join(target, name)))
+    
+    with ThreadPoolExecutor(max_workers=_COPY_WORKERS) as pool:
+        futures = [pool.submit(_copy_file, s, d) for s, d in files]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    
+    # Directory metadata last, as writing files into them updates mtimes
+    for src_dir, dst_dir in dirs:
+        shutil.copystat(src_dir, dst_dir)
+
+
+class LocalStorageBackend(StorageBackend):
+    """
+    Local file system storage backend.
+    
+    Useful for testing and simple use cases where data is stored locally
+    or on a mounted network drive.
+    
+    Remote URI format: file:///absolute/path/to/storage
+    or simply: /absolute/path/to/storage
+    """
+    
+    def __init__(self, remote_uri: str):
+        """
+        Initialize local storage backend.
+        
+        Args:
+            remote_uri: Base path for storage (e.g., "/data/datamole" or "file:///data/datamole")
+        """
+        # Strip file:// prefix if present
+        if remote_uri.startswith("file://"):
+            remote_uri = remote_uri[7:]
+        
+        self.base_path = Path(remote_uri).expanduser().resolve()
+        
+        # Create base directory if it doesn't exist
+        self.base_path.mkdir(parents=True, exist_ok=True)
+        
+        # Projects already set up by this instance; setup() skips these
+        self._ready_projects = set()
+    
+    def setup(self, project_name: str) -> None:
+        """
+        Set up storage for a project.
+        
+        For local backend, this creates the project directory and verifies write access.
+        
+        Args:
+            project_name: Name of the project
+            
+        Raises:
+            StorageError: If directory cannot be created or is not writable
+        """
+        if project_name in self._ready_projects:
+            return
+        
+        project_path = self.base_path / project_name
+        
+        try:
+            # Create project directory if it doesn't exist
+            project_path.mkdir(parents=True, exist_ok=True)
+            
+            # Verify write access by creating and removing a test file
+            test_file = project_path / ".datamole_test"
+            test_file.touch()
+            test_file.unlink()
+            
+        except PermissionError as e:
+            raise StorageError(f"No write permission for storage location: {self.base_path}") from e
+        except Exception as e:
+            raise StorageError(f"Failed to set up project storage: {e}") from e
+        
+        self._ready_projects.add(project_name)
+    
+    def reset_ready_cache(self) -> None:
+        """Forget which projects were set up, so setup() checks them again."""
+        self._ready_projects.clear()
+    
+    def _get_version_path(self, project_name: str, version_hash: str) -> Path:
+        """Get the storage path for a specific version."""
+        return self.base_path / project_name / version_hash
+    
+    def upload_directory(self, local_path: Path, remote_path: str) -> None:
+        """
+        Upload directory by copying to local storage location.
+        
+        Args:
+            local_path: Local directory to upload
+            remote_path: Format: "<project_name>/<version_hash>"
+        """
+        if not local_path.exists():
+            raise StorageError(f"Local path does not exist: {local_path}")
+        
+        if not local_path.is_dir():
+            raise StorageError(f"Local path is not a directory: {local_path}")
+        
+        # Parse remote_path (format: "project/hash")
+        parts = remote_path.split("/")
+        if len(parts) != 2:
+            raise StorageError(f"Invalid remote_path format: {remote_path}. Expected: project_name/version_hash")
+        
+        project_name, version_hash = parts
+        dest_path = self._get_version_path(project_name, version_hash)
+        
+        # Copy into a hidden sibling first and swap it into place with renames,
+        # so a failed upload never destroys an existing copy of the version
+        tmp_path = dest_path.with_name(f".{version_hash}.tmp")
+        old_path = dest_path.with_name(f".{version_hash}.old")
+        shutil.rmtree(tmp_path, ignore_errors=True)  # left over from a crash
+        try:
+            _fast_copytree(local_path, tmp_path)
+        except Exception as e:
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise StorageError(f"Failed to upload directory: {e}") from e
+        
+        try:
+            # Re-upload of an existing version (idempotency): move it aside,
+            # since a directory cannot be renamed over a non-empty one
+            if dest_path.exists():
+                shutil.rmtree(old_path, ignore_errors=True)
+                os.rename(dest_path, old_path)
+            os.rename(tmp_path, dest_path)
+        except OSError as e:
+            if old_path.exists() and not dest_path.exists():
+                os.rename(old_path, dest_path)
+            shutil.rmtree(tmp_path, ignore_errors=True)
+            raise StorageError(f"Failed to upload directory: {e}") from e
+        shutil.rmtree(old_path, ignore_errors=True)
+    
+    def download_directory(self, remote_path: str, local_path: Path) -> None:
+        """
+        Download directory by copying from local storage location.
+        
+        Args:
+            remote_path: Format: "<project_name>/<version_hash>"
+            local_path: Local destination directory
+        """
+        # Parse remote_path
+        parts = remote_path.split("/")
+        if len(parts) != 2:
+            raise StorageError(f"Invalid remote_path format: {remote_path}. Expected: project_name/version_hash")
+        
+        project_name, version_hash = parts
+        source_path = self._get_version_path(project_name, version_hash)
+        
+        if not source_path.exists():
+            raise StorageError(f"Version not found in storage: {remote_path}")
+        
+        # Remove destination if it exists
+        if local_path.exists():
+            shutil.rmtree(local_path)
+        
+        # Copy directory tree
+        try:
+            _fast_copytree(source_path, local_path)
+        except Exception as e:
+            raise StorageError(f"Failed to download directory: {e}") from e
+    
+    def list_versions(self, project_name: str) -> List[str]:
+        """
+        List all version hashes for a project.
+        
+        Args:
+            project_name: Name of the project
+            
+        Returns:
+            List of version hash strings
+        """
+        project_path = self.base_path / project_name
+        
+        # List all subdirectories (each is a version hash); DirEntry.is_dir()
+        # answers from the directory listing instead of a stat per entry.
+        # Dot-prefixed entries are in-progress or superseded uploads.
+        try:
+            with os.scandir(project_path) as entries:
+                return [entry.name for entry in entries
+                        if not entry.name.startswith(".") and entry.is_dir()]
+        except FileNotFoundError:
+            return []
+    
+    def version_exists(self, project_name: str, version_hash: str) -> bool:
+        """
+        Check if a version exists.
+        
+        Args:
+            project_name: Name of the project
+            version_hash: Version hash to check
+            
+        Returns:
+            True if version exists, False otherwise
+        """
+        version_path = self._get_version_path(project_name, version_hash)
+        return version_path.exists() and version_path.is_dir()
@@ -1,7 +1,8 @@
 """Shared pytest fixtures for datamole tests."""
 
 import pytest
-import os
+import yaml
+from pathlib import Path
 
 from datamole.storage import BackendType
 from datamole.config.global_config import GlobalConfig
@@ -12,22 +13,27 @@ def temp_home(tmp_path, monkeypatch):
     """Create a temporary home directory for testing."""
     fake_home = tmp_path / "home"
     fake_home.mkdir()
+    monkeypatch.setattr(Path, "home", classmethod(lambda cls: fake_home))
+    # Also sandbox os.path.expanduser and anything else that reads $HOME
     monkeypatch.setenv("HOME", str(fake_home))
     yield fake_home
 
 
+@pytest.fixture(scope="session")
+def load_yaml():
+    """Return a helper that parses a YAML file written by datamole."""
+    def load(path):
+        return yaml.safe_load(Path(path).read_text())
+    return load
+
+
 @pytest.fixture
-def temp_project(tmp_path, temp_home):
-    """Create a temporary project directory."""
+def temp_project(tmp_path, temp_home, monkeypatch):
+    """Create a temporary project directory and make it the working directory."""
     project_dir = tmp_path / "test_project"
     project_dir.mkdir()
-    
-    original_dir = os.getcwd()
-    os.chdir(project_dir)
-    
+    monkeypatch.chdir(project_dir)
     yield project_dir
-    
-    os.chdir(original_dir)
 
 
 @pytest.fixture
@@ -41,3 +47,44 @@ def configured_storage(temp_home):
     global_config.save()
     
     yield storage_path
+
+
+@pytest.fixture(scope="module")
+def initialized_dtm_ro(tmp_path_factory):
+    """DataMole project initialized once per module.
+    
+    Shared between tests, so only for ones that don't change the project.
+    """
+    from datamole.core import DataMole
+    
+    fake_home = tmp_path_factory.mktemp("home")
+    repo_dir = tmp_path_factory.mktemp("repo")
+    # DataMole keeps absolute paths, so only init() needs the global config
+    # and the project as the working directory
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Path, "home", classmethod(lambda cls: fake_home))
+        mp.setenv("HOME", str(fake_home))
+        mp.chdir(repo_dir)
+        GlobalConfig.reset()
+        global_config = GlobalConfig.initialize_defaults()
+        global_config.set_backend_config(BackendType.LOCAL,
+                                         storage_path=str(fake_home / "datamole_storage"))
+        global_config.save()
+        try:
+            dtm = DataMole()
+            dtm.init()
+        finally:
+            GlobalConfig.reset()
+    return dtm
+
+
+@pytest.fixture(scope="session")
+def pyproject():
+    """Parsed pyproject.toml, read once per session."""
+    try:
+        import tomllib  # Python 3.11+
+    except ImportError:
+        import tomli as tomllib  # Python 3.10
+    
+    pyproject_path = Path(__file__).parent.parent / "pyproject.toml"
+    return tomllib.loads(pyproject_path.read_text())
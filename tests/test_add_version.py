@@ -3,7 +3,7 @@ Tests for add_version() functionality.
 """
 
 import pytest
-import os
+from datetime import datetime, timedelta, timezone
 
 from datamole.core import DataMole
 from datamole.config.project import ProjectConfig
@@ -14,22 +14,6 @@ from datamole.storage import (
 from datamole.config.global_config import GlobalConfig
 
 
-@pytest.fixture
-def temp_project(tmp_path, temp_home):
-    """Create a temporary project directory."""
-    project_dir = tmp_path / "test_project"
-    project_dir.mkdir()
-    
-    # Change to project directory
-    original_dir = os.getcwd()
-    os.chdir(project_dir)
-    
-    yield project_dir
-    
-    # Restore original directory
-    os.chdir(original_dir)
-
-
 @pytest.fixture
 def initialized_project(temp_project, temp_home):
     """Create an initialized datamole project."""
@@ -126,7 +110,20 @@ class TestAddVersionSuccess:
         
         assert len(version_hash) == 8
         assert all(c in "0123456789abcdef" for c in version_hash)
-    
+
+    def test_add_version_records_utc_timestamp(self, project_with_data):
+        """Test that the timestamp is ISO 8601 UTC with microseconds."""
+        dtm, project_dir, storage_path, data_dir = project_with_data
+
+        dtm.add_version()
+
+        config = ProjectConfig.load(project_dir / ".datamole")
+        timestamp = config.versions[0]["timestamp"]
+
+        assert timestamp.endswith("Z")
+        parsed = datetime.strptime(timestamp, "%Y-%m-%dT%H:%M:%S.%fZ")
+        assert abs(datetime.now(timezone.utc).replace(tzinfo=None) - parsed) < timedelta(minutes=1)
+
     def test_add_version_uploads_to_storage(self, project_with_data):
         """Test that add_version uploads data to remote storage."""
         dtm, project_dir, storage_path, data_dir = project_with_data
@@ -231,18 +228,18 @@ class TestAddVersionHashCollision:
         config = ProjectConfig.load(project_dir / ".datamole")
         existing_hash = config.versions[0]["hash"]
         
-        # Mock secrets.token_hex to return existing hash first, then different hash
+        # Mock secrets.token_bytes to return existing hash first, then different hash
         import secrets
         call_count = [0]
         
-        def mock_token_hex(n):
+        def mock_token_bytes(n):
             call_count[0] += 1
             if call_count[0] == 1:
-                return existing_hash  # Collision
+                return bytes.fromhex(existing_hash)  # Collision
             else:
-                return "abcd1234"  # New unique hash
+                return bytes.fromhex("abcd1234")  # New unique hash
         
-        monkeypatch.setattr(secrets, "token_hex", mock_token_hex)
+        monkeypatch.setattr(secrets, "token_bytes", mock_token_bytes)
         
         # Modify data and add second version
         (data_dir / "new_file.txt").write_text("new")
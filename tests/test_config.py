@@ -69,7 +69,7 @@ def test_config_save_and_load(temp_dir):
     assert loaded_config.versions == []
 
 
-def test_config_yaml_format(temp_dir):
+def test_config_yaml_format(temp_dir, load_yaml):
     """Test that the saved YAML has correct structure."""
     config_path = os.path.join(temp_dir, ".datamole")
     
@@ -80,8 +80,7 @@ def test_config_yaml_format(temp_dir):
     )
     
     # Read the YAML directly
-    with open(config_path) as f:
-        data = yaml.safe_load(f)
+    data = load_yaml(config_path)
     
     assert data["project"] == "test_project"
     assert data["data_directory"] == "data"
@@ -287,3 +286,233 @@ def test_config_prevents_duplicate_creation(temp_dir):
             project="another_project",
             data_directory="other_data"
         )
+
+
+def test_config_get_versions_by_hash_prefix(temp_dir):
+    """Test prefix lookup returns all matches in history order."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    
+    config.add_version_entry("abcd9999", "2025-12-01T10:00:00")
+    config.add_version_entry("ffff0000", "2025-12-01T11:00:00")
+    config.add_version_entry("abcd1111", "2025-12-01T12:00:00")
+    
+    matches = config.get_versions_by_hash_prefix("abcd")
+    assert [v["hash"] for v in matches] == ["abcd9999", "abcd1111"]
+    assert config.get_versions_by_hash_prefix("ffff")[0]["hash"] == "ffff0000"
+    assert config.get_versions_by_hash_prefix("0000") == []
+    
+    with pytest.raises(ValueError, match="at least 4 characters"):
+        config.get_versions_by_hash_prefix("abc")
+
+
+def test_config_tag_lookup(temp_dir):
+    """Test tag lookups and duplicate tag rejection."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    
+    config.add_version_entry("abc123", "2025-12-01T10:00:00", tag="v1.0")
+    
+    assert config.has_tag("v1.0") is True
+    assert config.has_tag("v2.0") is False
+    assert config.get_version_by_tag("v1.0")["hash"] == "abc123"
+    assert config.get_version_by_tag("v2.0") is None
+    
+    with pytest.raises(ValueError, match="already exists"):
+        config.add_version_entry("def456", "2025-12-01T11:00:00", tag="v1.0")
+
+
+def test_config_lookups_see_directly_appended_versions(temp_dir):
+    """Test that lookups stay correct when versions is modified directly."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    
+    assert config.has_version("abc123") is False
+    
+    config.versions.append({"hash": "abc123", "timestamp": "2025-12-01T10:00:00", "tag": "v1.0"})
+    
+    assert config.has_version("abc123") is True
+    assert config.get_version_by_tag("v1.0")["hash"] == "abc123"
+
+
+def test_config_lookups_see_same_length_changes(temp_dir):
+    """Test that lookups stay correct when versions changes without growing."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    config.add_version_entry("aaaa1111", "2025-12-01T10:00:00", tag="v1")
+    config.add_version_entry("aaaa2222", "2025-12-01T11:00:00")
+    assert config.has_version("aaaa1111") is True
+    
+    # Replace an entry in place
+    config.versions[0] = {"hash": "bbbb2222", "timestamp": "2025-12-01T12:00:00"}
+    config._invalidate_indices()
+    assert config.has_version("bbbb2222") is True
+    assert config.has_version("aaaa1111") is False
+    assert config.get_version_by_tag("v1") is None
+    
+    # Pop followed by append
+    config.versions.pop()
+    config.versions.append({"hash": "cccc3333", "timestamp": "2025-12-01T13:00:00"})
+    config._invalidate_indices()
+    assert config.get_versions_by_hash_prefix("aaaa") == []
+    assert [v["hash"] for v in config.get_versions_by_hash_prefix("cccc")] == ["cccc3333"]
+    
+    # Assigning a new list of the same length
+    new_versions = [{"hash": "dddd4444", "timestamp": "2025-12-01T14:00:00"},
+                    {"hash": "eeee5555", "timestamp": "2025-12-01T15:00:00"}]
+    config.versions = new_versions
+    assert config.versions is new_versions
+    assert config.has_version("dddd4444") is True
+    assert config.has_version("cccc3333") is False
+    
+    config.save()
+    assert [v["hash"] for v in ProjectConfig.load(config_path).versions] == ["dddd4444", "eeee5555"]
+
+
+def test_config_save_leaves_no_temp_file(temp_dir):
+    """Test that save() replaces the file atomically without leftovers."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    config.current_version = "abc123"
+    config.save()
+    
+    assert os.listdir(temp_dir) == [".datamole"]
+    assert ProjectConfig.load(config_path).current_version == "abc123"
+
+
+def test_config_save_keeps_file_mode(temp_dir):
+    """Test that save() doesn't reset the permissions of an existing file."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    os.chmod(config_path, 0o600)
+    config.current_version = "abc123"
+    config.save()
+    
+    assert os.stat(config_path).st_mode & 0o777 == 0o600
+
+
+def test_config_add_version_entries(temp_dir):
+    """Test adding several version entries with a single save."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    
+    config.add_version_entries([
+        {"hash": "abc123", "timestamp": "2025-12-01T10:00:00", "tag": "v1.0"},
+        {"hash": "def456", "timestamp": "2025-12-01T11:00:00", "message": "Second"},
+    ])
+    
+    loaded = ProjectConfig.load(config_path)
+    assert [v["hash"] for v in loaded.versions] == ["abc123", "def456"]
+    assert loaded.get_version_by_tag("v1.0")["hash"] == "abc123"
+    assert loaded.versions[1]["message"] == "Second"
+
+
+def test_config_add_version_entries_is_all_or_nothing(temp_dir):
+    """Test that a bad entry leaves the versions list unchanged."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    config.add_version_entry("abc123", "2025-12-01T10:00:00", tag="v1.0")
+    
+    with pytest.raises(ValueError, match="already exists"):
+        config.add_version_entries([
+            {"hash": "def456", "timestamp": "2025-12-01T11:00:00"},
+            {"hash": "789abc", "timestamp": "2025-12-01T12:00:00", "tag": "v1.0"},
+        ])
+    
+    assert [v["hash"] for v in config.versions] == ["abc123"]
+    assert config.has_version("def456") is False
+    assert len(ProjectConfig.load(config_path).versions) == 1
+
+
+def test_config_get_absolute_data_path_tracks_data_directory(temp_dir):
+    """Test that the resolved path follows changes to data_directory."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    
+    assert config.get_absolute_data_path() == os.path.join(temp_dir, "data")
+    
+    config.data_directory = "other"
+    assert config.get_absolute_data_path() == os.path.join(temp_dir, "other")
+
+
+def test_config_load_cached_returns_independent_copies(temp_dir):
+    """Test that cached loads don't share mutable state."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    config = ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    config.add_version_entry("abc123", "2025-12-01T10:00:00")
+    
+    first = ProjectConfig.load_cached(config_path)
+    first.versions[0]["message"] = "changed in memory"
+    first.versions.append({"hash": "def456", "timestamp": "2025-12-01T11:00:00"})
+    
+    second = ProjectConfig.load_cached(config_path)
+    assert second == ProjectConfig.load(config_path)
+    assert second.versions == [{"hash": "abc123", "timestamp": "2025-12-01T10:00:00"}]
+
+
+def test_config_load_cached_sees_external_changes(temp_dir):
+    """Test that edits by other writers invalidate the cached parse."""
+    config_path = os.path.join(temp_dir, ".datamole")
+    
+    ProjectConfig.create(
+        file_path=config_path,
+        project="test_project",
+        data_directory="data"
+    )
+    assert ProjectConfig.load_cached(config_path).current_version is None
+    
+    with open(config_path, "w") as f:
+        yaml.dump({"project": "test_project", "data_directory": "data",
+                   "current_version": "abc123", "versions": []}, f)
+    
+    assert ProjectConfig.load_cached(config_path).current_version == "abc123"
@@ -1,8 +1,57 @@
+import subprocess
+import sys
+
 import datamole.core as core
 
+
 def test_init():
 
     instance = core.DataMole()
 
     assert instance is not None
 
+
+def test_package_exports_resolve_lazily():
+
+    # A fresh interpreter: this module has already imported datamole.core
+    script = (
+        "import sys, datamole\n"
+        "assert 'datamole.core' not in sys.modules, 'datamole.core imported eagerly'\n"
+        "assert 'DataMoleFileConfig' in dir(datamole)\n"
+        "DataMole = datamole.DataMole\n"
+        "assert DataMole is sys.modules['datamole.core'].DataMole\n"
+    )
+    result = subprocess.run([sys.executable, "-I", "-c", script],
+                            capture_output=True, text=True)
+
+    assert result.returncode == 0, result.stderr
+
+
+def test_load_config_parses_dot_config(tmp_path):
+
+    config_path = tmp_path / ".config"
+    config_path.write_text(
+        "# remote_uri = ignored\n"
+        "remote_uri = /mnt/shared/storage \n"
+        "unrelated=value\r\n"
+        "  auth_token=abc=def\n"
+    )
+
+    instance = core.DataMole(config_path=str(config_path))
+
+    assert instance.remote_uri == "/mnt/shared/storage"
+    assert instance.auth_token == "abc=def"
+
+
+def test_user_resolved_on_first_access(monkeypatch):
+
+    import getpass
+
+    calls = []
+    monkeypatch.setattr(getpass, "getuser", lambda: calls.append(1) or "alice")
+    instance = core.DataMole()
+
+    assert calls == []
+    assert instance.user == "alice"
+    assert instance.user == "alice"
+    assert calls == [1]
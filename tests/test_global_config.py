@@ -2,8 +2,8 @@
 Tests for global backend configuration and new storage architecture.
 """
 
+import copy
 import pytest
-import shutil
 import yaml
 
 from datamole.storage import (
@@ -14,26 +14,48 @@ from datamole.storage import (
 from datamole.config.global_config import GlobalConfig
 
 
-@pytest.fixture
-def temp_home(tmp_path, monkeypatch):
-    """Create a temporary home directory for testing."""
-    fake_home = tmp_path / "home"
-    fake_home.mkdir()
-    monkeypatch.setenv("HOME", str(fake_home))
-    yield fake_home
-
-
 @pytest.fixture
 def clean_datamole_dir(temp_home):
-    """Ensure ~/.datamole directory is clean for each test."""
-    datamole_dir = temp_home / ".datamole"
-    if datamole_dir.exists():
-        shutil.rmtree(datamole_dir)
+    """Ensure each test starts without a loaded global config.
+    
+    temp_home is a fresh directory per test, so ~/.datamole never exists yet.
+    """
     # Clear singleton cache to ensure each test starts fresh
-    GlobalConfig._instance = None
-    yield datamole_dir
+    GlobalConfig.reset()
+    yield temp_home / ".datamole"
     # Clean up singleton after test
-    GlobalConfig._instance = None
+    GlobalConfig.reset()
+
+
+@pytest.fixture
+def configured_local_backend(clean_datamole_dir, tmp_path):
+    """Save a local backend config and return (storage_path, loaded GlobalConfig)."""
+    storage_path = tmp_path / "storage"
+    global_config = GlobalConfig.initialize_defaults()
+    global_config.set_backend_config(BackendType.LOCAL, storage_path=str(storage_path))
+    global_config.save()
+    return storage_path, GlobalConfig.load()
+
+
+@pytest.fixture
+def in_memory_config(clean_datamole_dir, monkeypatch):
+    """Back GlobalConfig save/load with a dict instead of ~/.datamole/config.yaml.
+    
+    Yields the store; the saved config data is under store["data"].
+    """
+    store = {}
+    
+    def save(self):
+        store["data"] = copy.deepcopy(self._config)
+    
+    def load_from_disk(cls):
+        if "data" not in store:
+            raise FileNotFoundError("Global datamole configuration not found")
+        return cls(copy.deepcopy(store["data"]))
+    
+    monkeypatch.setattr(GlobalConfig, "save", save)
+    monkeypatch.setattr(GlobalConfig, "_load_from_disk", classmethod(load_from_disk))
+    yield store
 
 
 class TestBackendType:
@@ -46,13 +68,16 @@ class TestBackendType:
         assert BackendType.S3.value == "s3"
         assert BackendType.AZURE.value == "azure"
     
-    def test_from_string_valid(self):
+    @pytest.mark.parametrize("value,expected", [
+        ("local", BackendType.LOCAL),
+        ("LOCAL", BackendType.LOCAL),
+        ("gcs", BackendType.GCS),
+        ("s3", BackendType.S3),
+        ("azure", BackendType.AZURE),
+    ])
+    def test_from_string_valid(self, value, expected):
         """Test converting valid strings to enum."""
-        assert BackendType.from_string("local") == BackendType.LOCAL
-        assert BackendType.from_string("LOCAL") == BackendType.LOCAL
-        assert BackendType.from_string("gcs") == BackendType.GCS
-        assert BackendType.from_string("s3") == BackendType.S3
-        assert BackendType.from_string("azure") == BackendType.AZURE
+        assert BackendType.from_string(value) == expected
     
     def test_from_string_invalid(self):
         """Test that invalid strings raise ValueError."""
@@ -71,14 +96,13 @@ class TestGlobalConfig:
         
         assert config_dir == clean_datamole_dir
     
-    def test_get_config_path(self, clean_datamole_dir):
+    def test_get_config_path(self, temp_home):
         """Test that get_config_path returns correct path."""
         config_path = GlobalConfig.get_config_path()
         
-        assert config_path.name == "config.yaml"
-        assert config_path.parent.name == ".datamole"
+        assert config_path == temp_home / ".datamole" / "config.yaml"
     
-    def test_save_backend_config_creates_file(self, clean_datamole_dir):
+    def test_save_backend_config_creates_file(self, clean_datamole_dir, load_yaml):
         """Test saving backend config creates config file."""
         global_config = GlobalConfig.initialize_defaults()
         global_config.set_backend_config(BackendType.LOCAL, storage_path="/path/to/storage")
@@ -87,9 +111,7 @@ class TestGlobalConfig:
         config_path = GlobalConfig.get_config_path()
         assert config_path.exists()
         
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        
+        config = load_yaml(config_path)
         assert "backends" in config
         assert "local" in config["backends"]
         assert config["backends"]["local"]["storage_path"] == "/path/to/storage"
@@ -104,14 +126,13 @@ class TestGlobalConfig:
         )
         global_config.save()
         
-        config_path = GlobalConfig.get_config_path()
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        
-        assert config["backends"]["gcs"]["default_bucket"] == "my-bucket"
-        assert config["backends"]["gcs"]["service_account_json"] == "/path/to/creds.json"
+        # Re-read config.yaml itself, not the parsed cache
+        GlobalConfig.get_cache_path().unlink(missing_ok=True)
+        config = GlobalConfig.reload().get_backend_config(BackendType.GCS)
+        assert config["default_bucket"] == "my-bucket"
+        assert config["service_account_json"] == "/path/to/creds.json"
     
-    def test_save_backend_config_updates_existing(self, clean_datamole_dir):
+    def test_save_backend_config_updates_existing(self, in_memory_config):
         """Test that saving updates existing backend config."""
         # Save initial config
         global_config = GlobalConfig.initialize_defaults()
@@ -123,13 +144,10 @@ class TestGlobalConfig:
         global_config.set_backend_config(BackendType.LOCAL, storage_path="/new/path")
         global_config.save()
         
-        config_path = GlobalConfig.get_config_path()
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        
+        config = in_memory_config["data"]
         assert config["backends"]["local"]["storage_path"] == "/new/path"
     
-    def test_save_backend_config_preserves_other_backends(self, clean_datamole_dir):
+    def test_save_backend_config_preserves_other_backends(self, in_memory_config):
         """Test that saving one backend doesn't affect others."""
         # Save multiple backends
         global_config = GlobalConfig.initialize_defaults()
@@ -142,23 +160,16 @@ class TestGlobalConfig:
         global_config.set_backend_config(BackendType.LOCAL, storage_path="/new/local/path")
         global_config.save()
         
-        config_path = GlobalConfig.get_config_path()
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        
+        config = in_memory_config["data"]
         assert config["backends"]["local"]["storage_path"] == "/new/local/path"
         assert config["backends"]["gcs"]["default_bucket"] == "my-bucket"
     
-    def test_load_backend_config_success(self, clean_datamole_dir):
+    def test_load_backend_config_success(self, configured_local_backend):
         """Test loading existing backend config."""
-        global_config = GlobalConfig.initialize_defaults()
-        global_config.set_backend_config(BackendType.LOCAL, storage_path="/path/to/storage")
-        global_config.save()
-        
-        loaded_config = GlobalConfig.load()
+        storage_path, loaded_config = configured_local_backend
         config = loaded_config.get_backend_config(BackendType.LOCAL)
         
-        assert config["storage_path"] == "/path/to/storage"
+        assert config["storage_path"] == str(storage_path)
     
     def test_load_backend_config_no_file(self, clean_datamole_dir):
         """Test loading config when file doesn't exist."""
@@ -184,14 +195,12 @@ class TestGlobalConfig:
         config_path = GlobalConfig.get_config_path()
         assert config_path.exists()
         
-        with open(config_path) as f:
-            config = yaml.safe_load(f)
-        
-        assert "backends" in config
-        assert "local" in config["backends"]
-        assert "storage_path" in config["backends"]["local"]
+        # Re-read config.yaml itself, not the parsed cache
+        GlobalConfig.get_cache_path().unlink(missing_ok=True)
+        config = GlobalConfig.reload().get_backend_config(BackendType.LOCAL)
+        assert "storage_path" in config
     
-    def test_initialize_default_config_idempotent(self, clean_datamole_dir):
+    def test_initialize_default_config_idempotent(self, in_memory_config):
         """Test that initialize_defaults creates config if missing."""
         # Initialize defaults
         global_config1 = GlobalConfig.initialize_defaults()
@@ -205,18 +214,80 @@ class TestGlobalConfig:
         # Verify path is same (config not overwritten)
         assert global_config2.get_backend_config(BackendType.LOCAL)["storage_path"] == original_path
 
+    
+    def test_initialize_defaults_save_failure_not_cached(self, clean_datamole_dir, monkeypatch):
+        """Test that defaults that failed to save don't become the loaded config."""
+        def failing_dump_file(data, file_path):
+            raise OSError("disk full")
+        
+        monkeypatch.setattr("datamole._yaml.dump_file", failing_dump_file)
+        
+        with pytest.raises(OSError, match="disk full"):
+            GlobalConfig.initialize_defaults()
+        
+        with pytest.raises(FileNotFoundError, match="Global datamole configuration not found"):
+            GlobalConfig.load()
+    
+    def test_reset_forces_next_load_from_disk(self, clean_datamole_dir):
+        """Test that reset drops the singleton so load re-reads the file."""
+        first = GlobalConfig.initialize_defaults()
+        assert GlobalConfig.load() is first
+        
+        GlobalConfig.reset()
+        
+        second = GlobalConfig.load()
+        assert second is not first
+        assert second.get_backend_config(BackendType.LOCAL) == first.get_backend_config(BackendType.LOCAL)
+    
+    def test_load_uses_parsed_config_cache(self, clean_datamole_dir):
+        """Test that load caches the parsed config and reuses it."""
+        global_config = GlobalConfig.initialize_defaults()
+        global_config.set_backend_config(BackendType.LOCAL, storage_path="/cached/path")
+        global_config.save()
+        
+        GlobalConfig.reload()
+        assert GlobalConfig.get_cache_path().exists()
+        
+        loaded_config = GlobalConfig.reload()
+        assert loaded_config.get_backend_config(BackendType.LOCAL)["storage_path"] == "/cached/path"
+    
+    def test_save_drops_parsed_config_cache(self, clean_datamole_dir):
+        """Test that save removes the cache instead of writing it."""
+        global_config = GlobalConfig.initialize_defaults()
+        GlobalConfig.reload()
+        
+        global_config.save()
+        
+        assert not GlobalConfig.get_cache_path().exists()
+    
+    def test_cache_gets_config_file_mode(self, clean_datamole_dir):
+        """Test that the cache is no more readable than config.yaml."""
+        GlobalConfig.initialize_defaults()
+        GlobalConfig.get_config_path().chmod(0o600)
+        
+        GlobalConfig.reload()
+        
+        assert GlobalConfig.get_cache_path().stat().st_mode & 0o777 == 0o600
+    
+    def test_load_ignores_stale_cache(self, clean_datamole_dir):
+        """Test that editing config.yaml by hand invalidates the cache."""
+        GlobalConfig.initialize_defaults()
+        GlobalConfig.reload()
+        
+        config_path = GlobalConfig.get_config_path()
+        with open(config_path, 'w') as f:
+            yaml.dump({"backends": {"local": {"storage_path": "/edited/by/hand/path"}}}, f)
+        
+        loaded_config = GlobalConfig.reload()
+        assert loaded_config.get_backend_config(BackendType.LOCAL)["storage_path"] == "/edited/by/hand/path"
+
 
 class TestStorageBackendFactory:
     """Tests for create_storage_backend factory function."""
     
-    def test_create_local_backend(self, clean_datamole_dir, tmp_path):
+    def test_create_local_backend(self, configured_local_backend):
         """Test creating local backend from config."""
-        storage_path = tmp_path / "storage"
-        global_config = GlobalConfig.initialize_defaults()
-        global_config.set_backend_config(BackendType.LOCAL, storage_path=str(storage_path))
-        global_config.save()
-        
-        loaded_config = GlobalConfig.load()
+        storage_path, loaded_config = configured_local_backend
         backend_config = loaded_config.get_backend_config(BackendType.LOCAL)
         backend = create_storage_backend(BackendType.LOCAL, backend_config)
         
@@ -243,14 +314,9 @@ class TestStorageBackendFactory:
 class TestLocalStorageBackendSetup:
     """Tests for LocalStorageBackend.setup() method."""
     
-    def test_setup_creates_project_directory(self, clean_datamole_dir, tmp_path):
+    def test_setup_creates_project_directory(self, configured_local_backend):
         """Test that setup creates project directory."""
-        storage_path = tmp_path / "storage"
-        global_config = GlobalConfig.initialize_defaults()
-        global_config.set_backend_config(BackendType.LOCAL, storage_path=str(storage_path))
-        global_config.save()
-        
-        loaded_config = GlobalConfig.load()
+        storage_path, loaded_config = configured_local_backend
         backend_config = loaded_config.get_backend_config(BackendType.LOCAL)
         backend = create_storage_backend(BackendType.LOCAL, backend_config)
         backend.setup("test_project")
@@ -259,28 +325,18 @@ class TestLocalStorageBackendSetup:
         assert project_path.exists()
         assert project_path.is_dir()
     
-    def test_setup_verifies_write_access(self, clean_datamole_dir, tmp_path):
+    def test_setup_verifies_write_access(self, configured_local_backend):
         """Test that setup verifies write access."""
-        storage_path = tmp_path / "storage"
-        global_config = GlobalConfig.initialize_defaults()
-        global_config.set_backend_config(BackendType.LOCAL, storage_path=str(storage_path))
-        global_config.save()
-        
-        loaded_config = GlobalConfig.load()
+        _, loaded_config = configured_local_backend
         backend_config = loaded_config.get_backend_config(BackendType.LOCAL)
         backend = create_storage_backend(BackendType.LOCAL, backend_config)
         
         # Should not raise error
         backend.setup("test_project")
     
-    def test_setup_idempotent(self, clean_datamole_dir, tmp_path):
+    def test_setup_idempotent(self, configured_local_backend):
         """Test that setup can be called multiple times."""
-        storage_path = tmp_path / "storage"
-        global_config = GlobalConfig.initialize_defaults()
-        global_config.set_backend_config(BackendType.LOCAL, storage_path=str(storage_path))
-        global_config.save()
-        
-        loaded_config = GlobalConfig.load()
+        storage_path, loaded_config = configured_local_backend
         backend_config = loaded_config.get_backend_config(BackendType.LOCAL)
         backend = create_storage_backend(BackendType.LOCAL, backend_config)
         
@@ -149,8 +149,9 @@ class TestPullVersionLookup:
         (data_dir / "file1.txt").write_text("version 1")
         
         # Mock to force hash collision on prefix
-        with patch("secrets.token_hex") as mock_hex:
-            mock_hex.side_effect = ["aaaa1111", "aaaa2222"]  # Same 4-char prefix
+        with patch("secrets.token_bytes") as mock_bytes:
+            # Same 4-char prefix
+            mock_bytes.side_effect = [bytes.fromhex("aaaa1111"), bytes.fromhex("aaaa2222")]
             dtm.add_version(message="First")
             dtm.add_version(message="Second")
         
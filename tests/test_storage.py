@@ -2,8 +2,11 @@
 Tests for storage backend functionality.
 """
 
+import asyncio
+import os
 import pytest
 import shutil
+import datamole.storage.local
 from datamole.storage import (
     LocalStorageBackend, 
     StorageError
@@ -119,7 +122,33 @@ class TestLocalStorageBackend:
         
         # Verify original content restored
         assert (uploaded_path / "file1.txt").read_text() == "content1"
-    
+
+    def test_upload_directory_failure_keeps_existing_version(self, local_backend, temp_data_dir,
+                                                             temp_storage_dir, monkeypatch):
+        """Test that a failed re-upload leaves the stored version intact."""
+        remote_path = "test_project/abc123"
+        local_backend.upload_directory(temp_data_dir, remote_path)
+
+        def failing_copytree(src, dst):
+            dst.mkdir()
+            raise OSError("disk full")
+
+        monkeypatch.setattr(datamole.storage.local, "_fast_copytree", failing_copytree)
+
+        with pytest.raises(StorageError, match="disk full"):
+            local_backend.upload_directory(temp_data_dir, remote_path)
+
+        project_path = temp_storage_dir / "test_project"
+        assert (project_path / "abc123" / "file1.txt").read_text() == "content1"
+        assert sorted(p.name for p in project_path.iterdir()) == ["abc123"]
+
+    def test_upload_directory_async_default(self, local_backend, temp_data_dir, temp_storage_dir):
+        """Test that the async upload falls back to upload_directory."""
+        asyncio.run(local_backend.upload_directory_async(temp_data_dir, "test_project/abc123"))
+
+        uploaded_path = temp_storage_dir / "test_project" / "abc123"
+        assert (uploaded_path / "file1.txt").read_text() == "content1"
+
     def test_download_directory_success(self, local_backend, temp_data_dir, tmp_path):
         """Test successful directory download."""
         remote_path = "test_project/abc123"
@@ -185,7 +214,14 @@ class TestLocalStorageBackend:
         versions = local_backend.list_versions("project")
         assert len(versions) == 3
         assert set(versions) == {"hash1", "hash2", "hash3"}
-    
+
+    def test_list_versions_skips_in_progress_uploads(self, local_backend, temp_data_dir, temp_storage_dir):
+        """Test that hidden temporary upload directories are not listed."""
+        local_backend.upload_directory(temp_data_dir, "project/hash1")
+        (temp_storage_dir / "project" / ".hash2.tmp").mkdir()
+
+        assert local_backend.list_versions("project") == ["hash1"]
+
     def test_version_exists_true(self, local_backend, temp_data_dir):
         """Test version_exists returns True for existing version."""
         local_backend.upload_directory(temp_data_dir, "project/abc123")
@@ -224,3 +260,86 @@ class TestLocalStorageBackendSetup:
         
         project_path = local_backend.base_path / "test_project"
         assert project_path.exists()
+    
+    def test_setup_skips_repeat_checks_until_reset(self, local_backend):
+        """Test that repeat setup calls are skipped until reset_ready_cache()."""
+        local_backend.setup("test_project")
+        project_path = local_backend.base_path / "test_project"
+        project_path.rmdir()
+        
+        local_backend.setup("test_project")
+        assert not project_path.exists()
+        
+        local_backend.reset_ready_cache()
+        local_backend.setup("test_project")
+        assert project_path.is_dir()
+
+
+class TestFastCopytree:
+    """Tests for the directory copy helper used by LocalStorageBackend."""
+    
+    def test_copies_contents_and_metadata(self, temp_data_dir, tmp_path):
+        """Test that file contents, nesting and permissions are preserved."""
+        (temp_data_dir / "file1.txt").chmod(0o640)
+        dest = tmp_path / "copy"
+        
+        datamole.storage.local._fast_copytree(temp_data_dir, dest)
+        
+        assert (dest / "file1.txt").read_text() == "content1"
+        assert (dest / "subdir" / "file3.txt").read_text() == "content3"
+        assert (dest / "file1.txt").stat().st_mode & 0o777 == 0o640
+    
+    def test_falls_back_to_regular_copy(self, temp_data_dir, tmp_path, monkeypatch):
+        """Test the user-space fallback when in-kernel copies are unavailable."""
+        monkeypatch.setattr(datamole.storage.local, "_copy_file_in_kernel", lambda src, dst: False)
+        dest = tmp_path / "copy"
+        
+        datamole.storage.local._fast_copytree(temp_data_dir, dest)
+        
+        assert (dest / "file2.txt").read_text() == "content2"
+    
+    def test_short_kernel_copy_falls_back(self, temp_data_dir, tmp_path, monkeypatch):
+        """Test that a copy_file_range that stops early isn't taken as a full copy."""
+        local = datamole.storage.local
+        if not local._IS_LINUX:
+            pytest.skip("in-kernel copies are only used on Linux")
+        
+        def no_reflink(fd, request, arg):
+            raise OSError("reflinks not supported")
+        
+        monkeypatch.setattr(local.fcntl, "ioctl", no_reflink)
+        monkeypatch.setattr(local.os, "copy_file_range", lambda src, dst, count: 0)
+        src = str(temp_data_dir / "file1.txt")
+        dst = tmp_path / "file1.txt"
+        
+        assert local._copy_file_in_kernel(src, str(dst)) is False
+        local._copy_file(src, str(dst))
+        assert dst.read_text() == "content1"
+    
+    def test_propagates_copy_errors(self, temp_data_dir, tmp_path, monkeypatch):
+        """Test that a failure copying any file is raised to the caller."""
+        real_copy_file = datamole.storage.local._copy_file
+        
+        def failing_copy_file(src, dst):
+            if src.endswith("file3.txt"):
+                raise OSError("disk full")
+            real_copy_file(src, dst)
+        
+        monkeypatch.setattr(datamole.storage.local, "_copy_file", failing_copy_file)
+        
+        with pytest.raises(OSError, match="disk full"):
+            datamole.storage.local._fast_copytree(temp_data_dir, tmp_path / "copy")
+
+    def test_propagates_unreadable_directory(self, temp_data_dir, tmp_path, monkeypatch):
+        """Test that a subdirectory that cannot be listed fails the copy."""
+        real_scandir = os.scandir
+        
+        def failing_scandir(path="."):
+            if os.fspath(path).endswith("subdir"):
+                raise PermissionError(13, "Permission denied", os.fspath(path))
+            return real_scandir(path)
+        
+        monkeypatch.setattr(os, "scandir", failing_scandir)
+        
+        with pytest.raises(PermissionError):
+            datamole.storage.local._fast_copytree(temp_data_dir, tmp_path / "copy")